@@ -5,23 +5,98 @@
 # Date: 2025-11-14
 # Note: Handles contacts with CSV/JSON support, backups, and duplicate checking.
 
+import bisect
+import collections
 import csv
+import functools
+import gzip
 import json
 import os
 import re
 import shutil
 import sys
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from difflib import SequenceMatcher, get_close_matches
 
+# pyahocorasick finds many search terms in a single pass, also optional
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson serializes several times faster than stdlib json, but it's optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# rapidfuzz is much faster for name similarity, but it's optional
+try:
+    from rapidfuzz import fuzz as rf_fuzz
+    from rapidfuzz import process as rf_process
+except ImportError:
+    rf_fuzz = None
+    rf_process = None
+
+# rapidfuzz itself no longer pulls in numpy, but process.cdist imports it
+# at call time, so probe for it once here instead of crashing mid-merge
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Global settings and filenames
 db_file = "contacts.csv"
 json_db = "contacts.json"
 log_file = "error_log.txt"
 backup_folder = "backups"
-temp_file = ".temp_data.json"
+temp_file = ".temp_data.csv"
 headers = ["name", "phone", "email", "tags", "favorite"]
 
+# One contact in memory. Slots keep per-contact memory down and attribute
+# access is faster than the dict lookups we were doing everywhere.
+@dataclass(slots=True)
+class Contact:
+    name: str = ""
+    phone: str = ""
+    email: str = ""
+    tags: str = ""
+    favorite: bool = False
+
+# Build a Contact from a plain dict (JSON import, old snapshots)
+def contact_from_dict(d):
+    return Contact(
+        name=str(d.get("name") or "").strip(),
+        phone=str(d.get("phone") or "").strip(),
+        email=str(d.get("email") or "").strip(),
+        tags=str(d.get("tags") or "").strip(),
+        favorite=bool(d.get("favorite")),
+    )
+
+# Compile these once so bulk operations don't pay for it on every call
+_PHONE_NONDIGIT = re.compile(r"\D")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]{2,}$")
+_NAME_JUNK = re.compile(r"[^a-z0-9]+")
+
+# Lowercase a name and drop punctuation/spaces, used for duplicate buckets
+def normalize_name(name):
+    return _NAME_JUNK.sub("", name.lower())
+
+# Closest name to `name` out of candidates, or None (0.8/80 cutoff)
+def best_name_match(name, candidates):
+    if rf_process:
+        match = rf_process.extractOne(name, candidates,
+                                      scorer=rf_fuzz.ratio, score_cutoff=80)
+        return match[0] if match else None
+    hits = get_close_matches(name, candidates, n=1, cutoff=0.8)
+    return hits[0] if hits else None
+
+# Users can re-run the same /regex/ search, so keep compiled ones around
+@functools.lru_cache(maxsize=128)
+def _get_user_regex(pattern, flags):
+    return re.compile(pattern, flags)
+
 # Helper to write errors to a file so the program doesn't just crash
 def save_error(action, err_msg):
     if not os.path.exists(backup_folder):
@@ -43,33 +118,32 @@ def check_folder(path):
     except Exception as e:
         save_error("check_folder", e)
 
-# Save a temp copy of data for the Undo feature
-def save_temp_snapshot(data):
-    try:
-        with open(temp_file, "w") as f:
-            json.dump(data, f)
-    except Exception as e:
-        save_error("save_temp_snapshot", e)
-
-# Load the temp copy
+# Load the temp copy kept for the Undo feature
 def get_last_snapshot():
     try:
         if os.path.exists(temp_file):
-            with open(temp_file, "r") as f:
-                return json.load(f)
+            return read_csv_file(temp_file)
     except Exception as e:
         save_error("get_last_snapshot", e)
     return None
 
+# Deletion table that drops every ASCII character except the digits
+_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in "0123456789")
+)
+
 # Cleaning up phone numbers
 def clean_phone(number):
     if not number: return ""
     number = number.strip()
     # Keep the plus sign if it's there
     has_plus = number.startswith("+")
-    # Remove everything that isn't a number
-    cleaned = re.sub(r"\D", "", number)
-    
+    # Remove everything that isn't a number: translate is one C-level
+    # pass; the regex only runs if non-ASCII junk survived it
+    cleaned = number.translate(_NON_DIGITS)
+    if not cleaned.isascii():
+        cleaned = _PHONE_NONDIGIT.sub("", cleaned)
+
     if has_plus and cleaned:
         return "+" + cleaned
     return cleaned
@@ -84,8 +158,7 @@ def check_phone(number):
 
 def check_email(email):
     # Regex for email validation
-    pattern = r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]{2,}$"
-    if email and re.match(pattern, email.strip()):
+    if email and _EMAIL_RE.match(email.strip()):
         return True
     return False
 
@@ -100,33 +173,49 @@ def init_db():
             save_error("init_db", e)
             print("Could not create database file.")
 
+# Parsed CSV cache so every menu action doesn't re-read the whole file.
+# Keyed on the file's mtime and size so outside edits still get picked up.
+_cache = {"key": None, "data": None}
+
+# Parse one contacts CSV into a list (shared by load_data and undo)
+def read_csv_file(path):
+    data_list = []
+    with open(path, "r", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            if not row: continue
+
+            # Clean up None values just in case
+            vals = [(row.get(k) or "").strip() for k in headers[:-1]]
+
+            # Fix boolean for favorite
+            is_fav = str(row.get("favorite") or "").strip().lower()
+            c = Contact(*vals, favorite=is_fav in ["1", "true", "yes", "y"])
+
+            if c.name:
+                data_list.append(c)
+    return data_list
+
 # Load data from CSV
 def load_data():
-    data_list = []
     try:
-        with open(db_file, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if not row: continue
-                
-                # Clean up None values just in case
-                clean_row = {}
-                for k in headers:
-                    val = row.get(k, "")
-                    if val is None: val = ""
-                    clean_row[k] = val.strip()
-                
-                # Fix boolean for favorite
-                is_fav = str(clean_row.get("favorite", "")).lower()
-                clean_row["favorite"] = is_fav in ["1", "true", "yes", "y"]
-                
-                if clean_row["name"]:
-                    data_list.append(clean_row)
+        st = os.stat(db_file)
+        cache_key = (st.st_mtime_ns, st.st_size)
+        if cache_key == _cache["key"]:
+            return _cache["data"]
+    except OSError:
+        cache_key = None
+
+    try:
+        data_list = read_csv_file(db_file)
     except FileNotFoundError:
         return [] # Return empty if file doesn't exist yet
     except Exception as e:
         save_error("load_data", e)
         print("Error loading contacts.")
+        data_list = []
+    _cache["key"] = cache_key
+    _cache["data"] = data_list
     return data_list
 
 # Save data to CSV
@@ -134,37 +223,54 @@ def save_data(contacts, do_backup=True, save_undo=True):
     try:
         check_folder(backup_folder)
 
-        # Save undo snapshot
-        if save_undo:
-            old_data = load_data()
-            save_temp_snapshot(old_data)
+        # Any write makes the cached name index and search blobs stale
+        _name_index["src"] = None
+        _blob_cache["src"] = None
+
+        # Save undo snapshot as a plain byte copy of the current file,
+        # which is much cheaper than parsing it and re-serializing.
+        # copyfile skips the mtime/permission syscalls copy2 would do
+        if save_undo and os.path.exists(db_file):
+            shutil.copyfile(db_file, temp_file)
 
         # Daily Backup Logic
         if do_backup and os.path.exists(db_file):
             date_str = datetime.now().strftime("%Y%m%d")
-            # Check if we already made a backup today to save space
+            # One marker file holds the date of the last backup, so a
+            # single read replaces per-day marker files piling up
+            marker = os.path.join(backup_folder, "last_backup.txt")
             already_backed_up = False
             try:
-                for f in os.listdir(backup_folder):
-                    if f.startswith(f"backup_{date_str}"):
-                        already_backed_up = True
-                        break
-            except: pass
+                with open(marker) as mf:
+                    already_backed_up = mf.read().strip() == date_str
+            except OSError:
+                pass
 
             if not already_backed_up:
                 ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                shutil.copy2(db_file, os.path.join(backup_folder, f"backup_{ts}.csv"))
-
-        # Write actual file
-        with open(db_file, "w", newline="") as f:
+                # Compress daily backups, CSV shrinks a lot under gzip
+                dst = os.path.join(backup_folder, f"backup_{ts}.csv.gz")
+                with open(db_file, "rb") as src, gzip.open(dst, "wb") as out:
+                    shutil.copyfileobj(src, out)
+                with open(marker, "w") as mf:
+                    mf.write(date_str)
+
+        # Write actual file (drop the cache first in case the write fails)
+        # writerows over a generator keeps this one buffered streaming write
+        _cache["key"] = None
+        with open(db_file, "w", newline="", buffering=1 << 20) as f:
             writer = csv.DictWriter(f, fieldnames=headers)
             writer.writeheader()
-            for c in contacts:
-                # Convert boolean back to string for CSV
-                row = c.copy()
-                row["favorite"] = "1" if c.get("favorite") else "0"
-                writer.writerow(row)
-                
+            writer.writerows(
+                {**asdict(c), "favorite": "1" if c.favorite else "0"}
+                for c in contacts
+            )
+
+        # What we just wrote is what load_data would parse back
+        st = os.stat(db_file)
+        _cache["key"] = (st.st_mtime_ns, st.st_size)
+        _cache["data"] = contacts
+
     except Exception as e:
         save_error("save_data", e)
         print("Failed to save data.")
@@ -174,30 +280,69 @@ def show_list(contacts, sort_key="name"):
         print("\nList is empty.\n")
         return
 
-    # Sort logic
+    # Sort logic. Decorate-sort-undecorate: lower() runs once per row
+    # instead of once per comparison, and no key lambda is called.
+    # Sort a copy, the caller's list may be the cached one and reordering
+    # it would desync the cached search blobs (and persist view order)
     if sort_key == "favorite":
-        contacts.sort(key=lambda x: not x.get("favorite"))
+        contacts = sorted(contacts, key=lambda x: not x.favorite)
     else:
-        contacts.sort(key=lambda x: x.get(sort_key, "").lower())
-
-    # Formatting table
-    print("\n" + "-" * 60)
-    print(f"{'Fav':<4} {'Name':<20} {'Phone':<15} {'Tags'}")
-    print("-" * 60)
-    
-    for c in contacts:
-        star = "*" if c.get("favorite") else " "
-        n = c.get("name", "")
-        p = c.get("phone", "")
-        t = c.get("tags", "")
-        print(f"{star:<4} {n:<20} {p:<15} {t}")
-    print("-" * 60 + "\n")
+        decorated = [(getattr(c, sort_key, "").lower(), i, c)
+                     for i, c in enumerate(contacts)]
+        decorated.sort()
+        contacts = [c for _, _, c in decorated]
+
+    # Formatting table: build the whole thing and write it once, one
+    # print per row means one flush per row on large books
+    lines = ["", "-" * 60,
+             f"{'Fav':<4} {'Name':<20} {'Phone':<15} {'Tags'}",
+             "-" * 60]
+    lines.extend(
+        f"{'*' if c.favorite else ' ':<4} {c.name:<20} {c.phone:<15} {c.tags}"
+        for c in contacts
+    )
+    lines.append("-" * 60 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# Index of lowercase name -> contact, so lookups don't scan the whole list.
+# Rebuilt whenever we're handed a different list than last time.
+_name_index = {"src": None, "map": None}
+
+def get_index(contacts):
+    if _name_index["src"] is not contacts:
+        _name_index["src"] = contacts
+        _name_index["map"] = {c.name.lower(): c for c in contacts}
+    return _name_index["map"]
 
 def get_contact(name, contacts):
-    for c in contacts:
-        if c["name"].lower() == name.lower():
-            return c
-    return None
+    return get_index(contacts).get(name.lower())
+
+# Lowercased "all fields" strings for searching, cached per loaded list so
+# we don't rebuild and re-lower them on every query. The joined form (one
+# row per line plus start offsets) is for regex search in a single pass.
+_blob_cache = {"src": None, "blobs": None, "joined": None, "offsets": None}
+
+def get_blobs(contacts):
+    if _blob_cache["src"] is not contacts:
+        _blob_cache["src"] = contacts
+        _blob_cache["blobs"] = [
+            f"{c.name} {c.phone} {c.email} {c.tags}".lower() for c in contacts
+        ]
+        _blob_cache["joined"] = None
+        _blob_cache["offsets"] = None
+    return _blob_cache["blobs"]
+
+def get_joined_blob(contacts):
+    blobs = get_blobs(contacts)
+    if _blob_cache["joined"] is None:
+        offsets = []
+        pos = 0
+        for b in blobs:
+            offsets.append(pos)
+            pos += len(b) + 1  # +1 for the newline separator
+        _blob_cache["joined"] = "\n".join(blobs)
+        _blob_cache["offsets"] = offsets
+    return _blob_cache["joined"], _blob_cache["offsets"]
 
 # Feature 1: Add
 def add_new():
@@ -222,36 +367,36 @@ def add_new():
             print("Note: Email format looks wrong.")
 
         current_list = load_data()
-        
-        # check duplicates/similar names
-        all_names = [x["name"] for x in current_list]
-        similar = get_close_matches(name, all_names, n=1, cutoff=0.8)
-        
+
+        # check duplicates/similar names using the index keys directly
+        index = get_index(current_list)
+        similar = best_name_match(name.lower(), index.keys())
+
         if similar:
-            print(f"Found similar name: {similar[0]}")
+            target = index[similar]
+            print(f"Found similar name: {target.name}")
             ans = input("Merge with existing? (M) or Add New (A)? ").upper()
             if ans == "M":
                 # Merge logic
-                target = get_contact(similar[0], current_list)
                 if target:
-                    if not target["phone"]: target["phone"] = final_phone
-                    if not target["email"]: target["email"] = email
+                    if not target.phone: target.phone = final_phone
+                    if not target.email: target.email = email
                     # merge tags
-                    old_tags = target["tags"].split(",")
+                    old_tags = target.tags.split(",")
                     new_tags = tags.split(",")
                     combined = set([t.strip() for t in old_tags + new_tags if t.strip()])
-                    target["tags"] = ",".join(combined)
+                    target.tags = ",".join(combined)
                     save_data(current_list)
                     print("Merged successfully.")
                     return
 
-        new_c = {
-            "name": name,
-            "phone": final_phone,
-            "email": email,
-            "tags": tags,
-            "favorite": is_fav
-        }
+        new_c = Contact(
+            name=name,
+            phone=final_phone,
+            email=email,
+            tags=tags,
+            favorite=is_fav,
+        )
         current_list.append(new_c)
         save_data(current_list)
         print("Saved.")
@@ -261,7 +406,7 @@ def add_new():
 
 # Feature 3: Search
 def search_db():
-    query = input("Search (Name, Phone, Tag) or /regex/: ").strip()
+    query = input("Search (Name, Phone, Tag), terms separated by commas, or /regex/: ").strip()
     if not query: return
 
     data = load_data()
@@ -271,21 +416,35 @@ def search_db():
     if query.startswith("/") and query.endswith("/"):
         pattern = query[1:-1]
         try:
-            regex = re.compile(pattern, re.IGNORECASE)
-            for c in data:
-                # Check all fields
-                blob = f"{c['name']} {c['phone']} {c['email']} {c['tags']}"
-                if regex.search(blob):
-                    results.append(c)
+            regex = _get_user_regex(pattern, re.IGNORECASE)
+            # One scan over all rows joined by newlines, then map match
+            # offsets back to row numbers via the cached start offsets
+            joined, offsets = get_joined_blob(data)
+            hits = {bisect.bisect_right(offsets, m.start()) - 1
+                    for m in regex.finditer(joined)}
+            results = [data[i] for i in sorted(hits)]
         except:
             print("Invalid Regex.")
     else:
-        # Normal search
-        q = query.lower()
-        for c in data:
-            blob = f"{c['name']} {c['phone']} {c['email']} {c['tags']}".lower()
-            if q in blob:
-                results.append(c)
+        # Normal search over the cached lowercase blobs. Commas mean
+        # "match all of these terms", like the tag lists elsewhere
+        terms = [t.strip().lower() for t in query.split(",") if t.strip()]
+        blobs = get_blobs(data)
+        if len(terms) <= 1:
+            q = terms[0] if terms else query.lower()
+            results = [c for c, blob in zip(data, blobs) if q in blob]
+        elif ahocorasick:
+            # One automaton pass over each row instead of one scan per term
+            auto = ahocorasick.Automaton()
+            for t in terms:
+                auto.add_word(t, t)
+            auto.make_automaton()
+            need = len(set(terms))
+            results = [c for c, blob in zip(data, blobs)
+                       if len({t for _, t in auto.iter(blob)}) == need]
+        else:
+            results = [c for c, blob in zip(data, blobs)
+                       if all(t in blob for t in terms)]
     
     show_list(results)
 
@@ -299,18 +458,18 @@ def update_existing():
         print("Not found.")
         return
     
-    print(f"Editing {target['name']} (Press Enter to keep current value)")
-    
-    p = input(f"Phone [{target['phone']}]: ").strip()
-    e = input(f"Email [{target['email']}]: ").strip()
-    t = input(f"Tags [{target['tags']}]: ").strip()
-    f = input(f"Fav (y/n) [current: {target['favorite']}]: ").strip().lower()
-
-    if p: target["phone"] = clean_phone(p)
-    if e: target["email"] = e
-    if t: target["tags"] = t
-    if f in ["y", "yes"]: target["favorite"] = True
-    elif f in ["n", "no"]: target["favorite"] = False
+    print(f"Editing {target.name} (Press Enter to keep current value)")
+
+    p = input(f"Phone [{target.phone}]: ").strip()
+    e = input(f"Email [{target.email}]: ").strip()
+    t = input(f"Tags [{target.tags}]: ").strip()
+    f = input(f"Fav (y/n) [current: {target.favorite}]: ").strip().lower()
+
+    if p: target.phone = clean_phone(p)
+    if e: target.email = e
+    if t: target.tags = t
+    if f in ["y", "yes"]: target.favorite = True
+    elif f in ["n", "no"]: target.favorite = False
     
     save_data(data)
     print("Updated.")
@@ -319,13 +478,13 @@ def update_existing():
 def delete_one():
     name = input("Enter name to delete: ").strip()
     data = load_data()
-    
-    # Filter out the one we want to delete
-    new_list = [c for c in data if c["name"].lower() != name.lower()]
-    
-    if len(new_list) == len(data):
+    key = name.lower()
+
+    if key not in get_index(data):
         print("Contact not found.")
     else:
+        # Filter out the one we want to delete
+        new_list = [c for c in data if c.name.lower() != key]
         save_data(new_list)
         print("Deleted.")
 
@@ -337,19 +496,28 @@ def import_csv_bulk():
         return
     
     try:
-        with open(fname, "r") as f:
-            reader = csv.DictReader(f)
+        with open(fname, "r", newline="", buffering=1 << 20) as f:
+            # Plain reader + column indexes: DictReader builds a dict per
+            # row, which is the slow part of big imports
+            reader = csv.reader(f)
+            idx = {h.strip().lower(): i for i, h in enumerate(next(reader, []))}
+
+            def field(row, col):
+                i = idx.get(col)
+                return row[i] if i is not None and i < len(row) else ""
+
             new_items = []
             for r in reader:
+                if not r: continue
                 # Basic mapping
-                item = {
-                    "name": r.get("name", "").strip(),
-                    "phone": clean_phone(r.get("phone", "")),
-                    "email": r.get("email", "").strip(),
-                    "tags": r.get("tags", ""),
-                    "favorite": r.get("favorite", "").lower() in ["1", "true", "y"]
-                }
-                if item["name"]:
+                item = Contact(
+                    name=field(r, "name").strip(),
+                    phone=clean_phone(field(r, "phone")),
+                    email=field(r, "email").strip(),
+                    tags=field(r, "tags"),
+                    favorite=field(r, "favorite").lower() in ["1", "true", "y"],
+                )
+                if item.name:
                     new_items.append(item)
         
         current = load_data()
@@ -360,30 +528,64 @@ def import_csv_bulk():
         save_error("import_csv", e)
         print("Import failed.")
 
+# Find index pairs of probable duplicates. Scoring is separated from the
+# interactive merge so the whole computation can run up front, and with
+# rapidfuzz each bucket is scored in one cdist call that threads across
+# cores (workers=-1) instead of a Python pair loop.
+def find_similar_pairs(data):
+    # Bucket contacts by the start of their normalized name so we only
+    # compare names that could plausibly match, instead of every pair
+    buckets = collections.defaultdict(list)
+    for i, c in enumerate(data):
+        buckets[normalize_name(c.name)[:3]].append(i)
+
+    pairs = []
+    for bucket in buckets.values():
+        if len(bucket) < 2:
+            continue
+        names = [data[i].name.lower() for i in bucket]
+
+        if rf_process and numpy:
+            scores = rf_process.cdist(names, names, scorer=rf_fuzz.ratio,
+                                      workers=-1, score_cutoff=90)
+            for a in range(len(bucket)):
+                for b in range(a + 1, len(bucket)):
+                    if scores[a][b] > 90: # 90% match
+                        pairs.append((bucket[a], bucket[b]))
+        else:
+            # One reused matcher: set_seq2 caches its index of names[a],
+            # and the quick_ratio bounds skip the expensive full DP for
+            # pairs that can't possibly reach the threshold
+            matcher = SequenceMatcher()
+            for a in range(len(bucket)):
+                matcher.set_seq2(names[a])
+                for b in range(a + 1, len(bucket)):
+                    matcher.set_seq1(names[b])
+                    if (matcher.real_quick_ratio() > 0.9
+                            and matcher.quick_ratio() > 0.9
+                            and matcher.ratio() > 0.9): # 90% match
+                        pairs.append((bucket[a], bucket[b]))
+    return pairs
+
 def auto_merge():
     data = load_data()
     print("Checking for duplicates...")
     to_remove = []
+
+    for i, j in find_similar_pairs(data):
+        c1 = data[i]
+        c2 = data[j]
+        print(f"\nMatch: {c1.name} <--> {c2.name}")
+        choice = input("Merge into one? (y/n): ").lower()
+        if choice == 'y':
+            # Combine data into c1
+            if not c1.phone: c1.phone = c2.phone
+            c1.tags = c1.tags + "," + c2.tags
+            to_remove.append(j)
     
-    # Compare every contact with every other contact
-    for i in range(len(data)):
-        for j in range(i + 1, len(data)):
-            c1 = data[i]
-            c2 = data[j]
-            
-            # Check similarity
-            ratio = SequenceMatcher(None, c1["name"].lower(), c2["name"].lower()).ratio()
-            if ratio > 0.9: # 90% match
-                print(f"\nMatch: {c1['name']} <--> {c2['name']}")
-                choice = input("Merge into one? (y/n): ").lower()
-                if choice == 'y':
-                    # Combine data into c1
-                    if not c1['phone']: c1['phone'] = c2['phone']
-                    c1['tags'] = c1['tags'] + "," + c2['tags']
-                    to_remove.append(j)
-    
-    # Create clean list
-    final_list = [data[i] for i in range(len(data)) if i not in to_remove]
+    # Create clean list (set membership, the list version was O(N*removed))
+    to_remove_set = set(to_remove)
+    final_list = [c for i, c in enumerate(data) if i not in to_remove_set]
     if len(final_list) != len(data):
         save_data(final_list)
         print("Duplicates merged.")
@@ -393,8 +595,13 @@ def auto_merge():
 # Export features
 def export_json():
     data = load_data()
-    with open(json_db, "w") as f:
-        json.dump(data, f, indent=4)
+    rows = [asdict(c) for c in data]
+    if orjson:
+        with open(json_db, "wb") as f:
+            f.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_db, "w") as f:
+            json.dump(rows, f, indent=4)
     print(f"Saved to {json_db}")
 
 def export_vcard():
@@ -405,12 +612,12 @@ def export_vcard():
         print("Not found.")
         return
     
-    fname = c["name"].replace(" ", "_") + ".vcf"
+    fname = c.name.replace(" ", "_") + ".vcf"
     with open(fname, "w") as f:
         f.write("BEGIN:VCARD\nVERSION:3.0\n")
-        f.write(f"N:{c['name']}\n")
-        if c['phone']: f.write(f"TEL:{c['phone']}\n")
-        if c['email']: f.write(f"EMAIL:{c['email']}\n")
+        f.write(f"N:{c.name}\n")
+        if c.phone: f.write(f"TEL:{c.phone}\n")
+        if c.email: f.write(f"EMAIL:{c.email}\n")
         f.write("END:VCARD\n")
     print(f"Created {fname}")
 
@@ -420,7 +627,7 @@ def manual_backup():
         check_folder(backup_folder)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         dst = os.path.join(backup_folder, f"manual_backup_{ts}.csv")
-        shutil.copy2(db_file, dst)
+        shutil.copyfile(db_file, dst)
         print(f"Backup saved: {dst}")
     except Exception as e:
         print(f"Backup failed: {e}")
@@ -428,8 +635,8 @@ def manual_backup():
 def restore_backup():
     check_folder(backup_folder)
     files = sorted(os.listdir(backup_folder))
-    csvs = [x for x in files if x.endswith(".csv")]
-    
+    csvs = [x for x in files if x.endswith(".csv") or x.endswith(".csv.gz")]
+
     if not csvs:
         print("No backups found.")
         return
@@ -440,8 +647,12 @@ def restore_backup():
     
     try:
         sel = int(input("Select number: ")) - 1
-        target = csvs[sel]
-        shutil.copy2(os.path.join(backup_folder, target), db_file)
+        target = os.path.join(backup_folder, csvs[sel])
+        if target.endswith(".gz"):
+            with gzip.open(target, "rb") as src, open(db_file, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            shutil.copyfile(target, db_file)
         print("Restored.")
     except:
         print("Invalid selection.")
@@ -490,7 +701,7 @@ def main():
             try:
                 with open(json_db) as f:
                     d = json.load(f)
-                    save_data(d)
+                    save_data([contact_from_dict(x) for x in d])
                     print("Imported.")
             except: print("Failed.")
         elif ch == "8": import_csv_bulk()